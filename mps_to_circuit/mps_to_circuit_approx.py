@@ -13,7 +13,7 @@
 import numpy as np
 from qiskit import QuantumCircuit
 
-from .mps_to_circuit_exact import _mps_to_circuit_exact
+from .mps_to_circuit_exact import _canonical_mps_to_circuit
 from .utils import _prepare_mps
 
 
@@ -26,6 +26,7 @@ def _mps_to_circuit_approx(
     cutoff: float = 1e-3,
     chi_max: int | None = None,
     history: dict | None = None,
+    seed: int | np.random.Generator | None = None,
 ) -> QuantumCircuit:
     """Convert a matrix product state to a quantum circuit.
 
@@ -42,51 +43,54 @@ def _mps_to_circuit_approx(
     :param cutoff: Cutoff threshold for the compression. Defaults to 0.001.
     :param chi_max: See description for compress. `chi_max` will be ignored if compress is `False`.
     :param history: Dictionary to store intermediate data from algorithm.
+    :param seed: Seed or random number generator used to complete the isometries of each layer to
+        unitaries. The fidelity of the circuit depends on these random completions, so fix the seed
+        for reproducible results.
 
     :return: A quantum circuit consisting of `num_layers` of two-qubit isometries that approximately
         represents the input MPS.
     """
     # Prepare Quimb MPS in the correct form.
-    _mps = _prepare_mps(mps, shape)
-    compressed_mps = _mps.copy(deep=True)
-    disentangled_mps = _mps.copy(deep=True)
+    disentangled_mps = _prepare_mps(mps, shape)
+    rng = np.random.default_rng(seed)
 
     # Check chi_max.
     if not compress and chi_max is not None:
         print("Warning: `chi_max` is ignored when compress is `False`.")
 
     if chi_max is None:
-        chi_max = _mps.max_bond()
+        chi_max = disentangled_mps.max_bond()
 
     assert chi_max > 0, "`chi_max` must be an integer greater than 0."
 
-    final_circuit = None
+    circuits = []
 
     layer = 0
     while layer < num_layers:
         # Compress the MPS from the previous layer to a maximum bond dimension of 2,
-        # |ψ_k> -> |ψ'_k>.
-        compressed_mps = disentangled_mps.copy(deep=True)
+        # |ψ_k> -> |ψ'_k>. Quimb replaces rather than overwrites the tensor data, so a shallow
+        # copy leaves |ψ_k> untouched.
+        compressed_mps = disentangled_mps.copy()
         compressed_mps.compress(form="left", max_bond=2)
         compressed_mps.normalize()
 
-        # Find the unitary U_k such that |ψ'_k> = U_k @ |0>.
-        circuit = _mps_to_circuit_exact(list(compressed_mps.arrays), shape="lrp")
+        # Find the unitary U_k such that |ψ'_k> = U_k @ |0>. The compressed MPS is already in
+        # left-canonical form, so it does not need to be prepared again.
+        circuit = _canonical_mps_to_circuit(compressed_mps, rng)
 
-        unitaries = [instruction.operation.to_matrix() for instruction in circuit.data]
+        inverses = [
+            instruction.operation.to_matrix().conj().T
+            for instruction in reversed(circuit.data)
+        ]
 
-        # inv(U_k) @ ... @ inv(U_1) @ inv(U_0) @ |0>.
-        final_circuit = (
-            circuit.compose(final_circuit) if final_circuit is not None else circuit
-        )
+        circuits.append(circuit)
 
         if history is not None:
-            history["circuits"].append(final_circuit)
+            history["circuits"].append(_compose_layers(circuits, disentangled_mps.L))
 
         # Apply the inverse of U_k to disentangle |ψ_k>,
         # |ψ_(k+1)> = inv(U_k) @ |ψ_k>.
-        for i, _ in enumerate(unitaries):
-            inverse = unitaries[-(i + 1)].conj().T
+        for i, inverse in enumerate(inverses):
             if inverse.shape[0] == 4:
                 disentangled_mps.gate_split(
                     inverse, (i - 1, i), inplace=True, cutoff=cutoff
@@ -101,4 +105,21 @@ def _mps_to_circuit_approx(
         layer += 1
 
     # Return final circuit.
+    return _compose_layers(circuits, disentangled_mps.L)
+
+
+def _compose_layers(circuits: list[QuantumCircuit], num_qubits: int) -> QuantumCircuit:
+    """Compose the circuits of successive layers into a single circuit.
+
+    The circuit of the latest layer acts first, i.e. inv(U_k) @ ... @ inv(U_1) @ inv(U_0) @ |0>.
+    Each layer is appended in place once, so the cost is linear in the total number of gates.
+
+    :param circuits: The circuits of each layer, in the order they were found.
+    :param num_qubits: The number of qubits of the composed circuit.
+
+    :return: The composed circuit.
+    """
+    final_circuit = QuantumCircuit(num_qubits)
+    for circuit in reversed(circuits):
+        final_circuit.compose(circuit, inplace=True)
     return final_circuit
@@ -12,9 +12,11 @@
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import UnitaryGate
+from quimb.tensor import MatrixProductState
 
 from .utils import (
-    _gram_schmidt,
+    _complete_unitary,
     _has_orthonormal_columns,
     _is_unitary,
     _pad_tensor,
@@ -26,6 +28,7 @@ def _mps_to_circuit_exact(
     mps: list[np.ndarray],
     *,
     shape: str = "lrp",
+    seed: int | np.random.Generator | None = None,
 ) -> QuantumCircuit:
     """Convert a matrix product state to a quantum circuit.
 
@@ -37,14 +40,31 @@ def _mps_to_circuit_exact(
         default.
     :param shape: Encodes which index each tensor dimension corresponds to, where `l` is the left
         virtual index, `r` is the right virtual index and `p` is the physical index.
+    :param seed: Seed or random number generator used to complete the isometries to unitaries.
 
     :return: A quantum circuit consisting of multi-qubit isometries that represents the input MPS.
     """
-    _mps = _prepare_mps(mps, shape=shape)
-    num_sites = _mps._L
+    rng = np.random.default_rng(seed)
+    return _canonical_mps_to_circuit(_prepare_mps(mps, shape=shape), rng)
+
+
+def _canonical_mps_to_circuit(
+    mps: MatrixProductState, rng: np.random.Generator | None = None
+) -> QuantumCircuit:
+    """Convert a left-canonical Quimb matrix product state to a quantum circuit.
+
+    :param mps: A Quimb MPS in left-canonical form, such as one returned by `_prepare_mps`.
+    :param rng: Random number generator used to complete the isometries to unitaries.
+
+    :return: A quantum circuit consisting of multi-qubit isometries that represents the input MPS.
+    """
+    num_sites = mps._L
     circuit = QuantumCircuit(num_sites)
 
-    for i, tensor in reversed(list(enumerate(_mps.arrays))):
+    arrays = mps.arrays
+    for i in reversed(range(num_sites)):
+        tensor = arrays[i]
+
         # Convert to a dense NumPy array and pad until virtual dimensions are powers of 2.
         # Quimb defines the indices of the MPS tensors as (d_left, d_right, d), but the left and
         # right end tensors do not have a left and right dimension, respectively.
@@ -56,6 +76,7 @@ def _mps_to_circuit_exact(
             tensor = tensor.reshape((d_left, 1, d))
 
         tensor = np.swapaxes(tensor, 1, 2)
+        num_columns = tensor.shape[2]
         padded_tensor = _pad_tensor(tensor)
 
         # Combine the physical index and right-virtual index of the tensor to construct an isometry
@@ -64,27 +85,24 @@ def _mps_to_circuit_exact(
         isometry = padded_tensor.reshape((d * d_left, d_right))
         assert _has_orthonormal_columns(isometry)
 
-        # Reverse the order of qubits for consistency with Qiskit's little-endian ordering.
-        qubits = list(reversed(range(i - int(np.ceil(np.log2(d_left))), i + 1)))
-
-        # Create all-zero matrix and add the isometry columns.
-        matrix = np.zeros((isometry.shape[0], isometry.shape[0]), dtype=isometry.dtype)
-
-        # Keep columns for which all ancillas are in the zero state.
-        matrix[:, : isometry.shape[1]] = isometry
+        # Reverse the order of qubits for consistency with Qiskit's little-endian ordering. The
+        # padded left dimension is a power of 2, so its bit length gives the number of qubits.
+        qubits = list(reversed(range(i - (d_left.bit_length() - 1), i + 1)))
 
-        # Apply Gram-Schmidt process.
-        unitary = _gram_schmidt(matrix)
+        # Complete the isometry to a unitary, keeping the columns for which all ancillas are in
+        # the zero state.
+        unitary = _complete_unitary(isometry, rng)
 
-        # Check that the columns of the isometry have been preserved.
-        for j in range(isometry.shape[1]):
-            if not np.all(isometry[:, j] == 0.0):
-                assert np.allclose(unitary[:, j], isometry[:, j])
+        if __debug__:
+            # Check that the columns of the isometry have been preserved. Padding only adds
+            # all-zero columns after the original `num_columns` columns.
+            assert np.allclose(unitary[:, :num_columns], isometry[:, :num_columns])
 
-        # Check that the final matrix operator is unitary.
-        assert _is_unitary(unitary)
+            # Check that the final matrix operator is unitary.
+            assert _is_unitary(unitary)
 
-        # Apply unitary to the circuit.
-        circuit.unitary(unitary, qubits)
+        # Apply unitary to the circuit. The unitary is correct by construction, so skip the
+        # unitarity check that Qiskit would otherwise repeat.
+        circuit.append(UnitaryGate(unitary, check_input=False), qubits)
 
     return circuit
@@ -10,6 +10,7 @@
 
 
 from .matrix import (
+    _complete_unitary,
     _gram_schmidt,
     _has_orthonormal_columns,
     _is_unitary,
@@ -20,6 +21,7 @@ from .tensor import (
 )
 
 __all__ = [
+    "_complete_unitary",
     "_gram_schmidt",
     "_has_orthonormal_columns",
     "_is_unitary",
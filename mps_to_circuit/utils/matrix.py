@@ -20,14 +20,17 @@ def _has_orthonormal_columns(matrix: np.ndarray) -> bool:
 
     :return: True if the matrix has orthonormal columns, False otherwise.
     """
-    # Filter out all-zero columns.
-    non_zero_columns = matrix[:, np.linalg.norm(matrix, axis=0) > 0]
+    gram_matrix = matrix.conj().T @ matrix
 
-    assert non_zero_columns.shape[1] > 0, "Requires at least one non-zero column."
+    # Filter out all-zero columns using the diagonal of the Gram matrix.
+    non_zero_columns = np.diag(gram_matrix).real > 0
+    num_non_zero_columns = np.count_nonzero(non_zero_columns)
+
+    assert num_non_zero_columns > 0, "Requires at least one non-zero column."
 
     # Check if the remaining columns are mutually orthonormal.
-    gram_matrix = non_zero_columns.conj().T @ non_zero_columns
-    return np.allclose(gram_matrix, np.eye(non_zero_columns.shape[1]))
+    gram_matrix = gram_matrix[np.ix_(non_zero_columns, non_zero_columns)]
+    return np.allclose(gram_matrix, np.eye(num_non_zero_columns))
 
 
 def _is_unitary(matrix: np.ndarray) -> bool:
@@ -43,37 +46,61 @@ def _is_unitary(matrix: np.ndarray) -> bool:
     return np.allclose(matrix @ matrix.conj().T, np.eye(matrix.shape[0]))
 
 
-def _gram_schmidt(matrix: np.ndarray) -> np.ndarray:
-    """Perform the Gram-Schmidt process on a matrix.
+def _complete_unitary(
+    isometry: np.ndarray, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """Complete an isometry to a unitary matrix.
 
-    :param matrix: Assumed to be a real or complex matrix with linearly independent columns.
+    The non-zero columns of the isometry are kept in place, while the all-zero columns and any
+    missing columns are filled with an orthonormal basis of the orthogonal complement.
+
+    :param isometry: Real or complex matrix whose non-zero columns are orthonormal.
+    :param rng: Random number generator used to fill the missing columns. A freshly seeded
+        generator is used if not given.
 
     :return: A unitary matrix.
     """
-    num_rows, num_cols = matrix.shape
-    unitary = np.zeros((num_rows, num_cols), dtype=matrix.dtype)
-
-    orthonormal_basis = []
-    for j in range(num_cols):
-        col = matrix[:, j].copy()
-        if not np.allclose(col, np.zeros(len(col))):
-            orthonormal_basis += [col]
-
-    for j in range(num_cols):
-        basis = np.array(orthonormal_basis)
-        col = matrix[:, j].copy()
-        if np.allclose(col, np.zeros(len(col))):
-            if np.iscomplexobj(unitary):
-                col = np.random.uniform(-1, 1, len(col)) + 1j * np.random.uniform(
-                    -1, 1, len(col)
-                )
-            else:
-                col = np.random.uniform(-1, 1, len(col))
-
-            for vec in basis:
-                col -= (vec.conj().T @ col) / (vec.conj().T @ vec) * vec
-
-        unitary[:, j] = col / np.linalg.norm(col)
-        orthonormal_basis += [unitary[:, j]]
+    if rng is None:
+        rng = np.random.default_rng()
+
+    num_rows, num_cols = isometry.shape
+
+    non_zero_columns = np.zeros(num_rows, dtype=bool)
+    non_zero_columns[:num_cols] = np.any(isometry != 0, axis=0)
+    columns = isometry[:, non_zero_columns[:num_cols]]
+    num_missing = num_rows - columns.shape[1]
+
+    # A square isometry without zero columns is already unitary.
+    if num_missing == 0:
+        return isometry
+
+    # Project random vectors onto the orthogonal complement of the isometry and orthonormalize.
+    random = rng.standard_normal((num_rows, num_missing))
+    if np.iscomplexobj(isometry):
+        random = random + 1j * rng.standard_normal((num_rows, num_missing))
+    random -= columns @ (columns.conj().T @ random)
+    complement, _ = np.linalg.qr(random)
+
+    unitary = np.empty((num_rows, num_rows), dtype=complement.dtype)
+    unitary[:, non_zero_columns] = columns
+    unitary[:, ~non_zero_columns] = complement
 
     return unitary
+
+
+def _gram_schmidt(
+    matrix: np.ndarray, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """Perform the Gram-Schmidt process on a matrix.
+
+    The non-zero columns are normalized and kept in place, while the all-zero columns are replaced
+    by an orthonormal basis of the orthogonal complement using `_complete_unitary`.
+
+    :param matrix: Assumed to be a real or complex square matrix whose non-zero columns are
+        mutually orthogonal.
+    :param rng: Random number generator passed to `_complete_unitary`.
+
+    :return: A unitary matrix.
+    """
+    norms = np.linalg.norm(matrix, axis=0)
+    return _complete_unitary(matrix / np.where(norms > 0, norms, 1), rng)
@@ -13,19 +13,21 @@
 import numpy as np
 from quimb.tensor import MatrixProductState
 
-from .math import _next_power_of_two
-
 
 def _pad_tensor(tensor: np.ndarray) -> np.ndarray:
     """Pad tensor so that both virtual dimensions have power two.
 
     :param tensor: Rank-3 tensor to pad.
 
-    :return: Padded tensor where both virtual dimensions have power 2.
+    :return: Padded tensor where both virtual dimensions have power 2. The input tensor itself is
+        returned if no padding is required.
     """
     d_left, d, d_right = tensor.shape
-    new_d_left = _next_power_of_two(d_left)
-    new_d_right = _next_power_of_two(d_right)
+    new_d_left = 1 << (d_left - 1).bit_length()
+    new_d_right = 1 << (d_right - 1).bit_length()
+    if new_d_left == d_left and new_d_right == d_right:
+        return tensor
+
     padded_tensor = np.zeros((new_d_left, d, new_d_right), dtype=tensor.dtype)
     padded_tensor[:d_left, :, :d_right] = tensor
     return padded_tensor
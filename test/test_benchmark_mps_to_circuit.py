@@ -0,0 +1,32 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmark MPS to circuit."""
+
+import pytest
+from quimb.tensor import MPS_rand_state
+
+from mps_to_circuit import mps_to_circuit
+
+# The benchmarks are only collected when pytest-benchmark is installed.
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("method", ["exact", "approximate"])
+@pytest.mark.parametrize("chi_max", range(1, 17))
+def test_perf_mps_to_circuit(benchmark, method, chi_max):
+    """Benchmark MPS to quantum circuit conversion function."""
+
+    mps = MPS_rand_state(L=8, bond_dim=chi_max, seed=chi_max)
+    arrays = list(mps.arrays)
+
+    benchmark.pedantic(
+        lambda: mps_to_circuit(list(arrays), method=method), rounds=20, iterations=3
+    )
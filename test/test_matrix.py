@@ -0,0 +1,77 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test matrix utility functions."""
+
+import numpy as np
+import pytest
+
+from mps_to_circuit.utils import _complete_unitary, _gram_schmidt, _is_unitary
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_complete_unitary_keeps_non_zero_columns(dtype):
+    """
+    Test completing an isometry with zero columns between non-zero columns.
+    - The result should be an 8x8 unitary of the same kind (real or complex) as the isometry
+    - The non-zero columns should be preserved in place
+    """
+
+    rng = np.random.default_rng(0)
+    columns, _ = np.linalg.qr(rng.standard_normal((8, 3)).astype(dtype))
+    isometry = np.zeros((8, 5), dtype=dtype)
+    isometry[:, [1, 2, 4]] = columns
+
+    unitary = _complete_unitary(isometry)
+
+    assert unitary.shape == (8, 8)
+    assert np.iscomplexobj(unitary) == np.iscomplexobj(isometry)
+    assert _is_unitary(unitary)
+    assert np.allclose(unitary[:, [1, 2, 4]], columns)
+
+
+def test_complete_unitary_returns_square_unitary_unchanged():
+    """Test completing a square isometry without zero columns returns it unchanged."""
+
+    matrix, _ = np.linalg.qr(np.random.default_rng(0).standard_normal((4, 4)))
+
+    assert _complete_unitary(matrix) is matrix
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_gram_schmidt_keeps_columns_after_zero_column(dtype):
+    """
+    Test the Gram-Schmidt process on a matrix with a zero column before non-zero columns.
+    - The result should be unitary
+    - The non-zero columns should be preserved
+    """
+
+    matrix = np.zeros((4, 4), dtype=dtype)
+    matrix[:, 1] = np.array([1, 1, 0, 0]) / np.sqrt(2)
+    matrix[:, 2] = np.array([0, 0, 1, 0])
+
+    unitary = _gram_schmidt(matrix)
+
+    assert _is_unitary(unitary)
+    assert np.allclose(unitary[:, 1:3], matrix[:, 1:3])
+
+
+def test_gram_schmidt_normalizes_columns():
+    """Test the Gram-Schmidt process normalizes orthogonal non-zero columns."""
+
+    matrix = np.zeros((4, 4))
+    matrix[:, 0] = np.array([0, 0, 0, 3])
+    matrix[:, 3] = np.array([1, -1, 0, 0])
+
+    unitary = _gram_schmidt(matrix)
+
+    assert _is_unitary(unitary)
+    assert np.allclose(unitary[:, 0], [0, 0, 0, 1])
+    assert np.allclose(unitary[:, 3], np.array([1, -1, 0, 0]) / np.sqrt(2))
@@ -10,17 +10,39 @@
 
 """Test MPS to circuit."""
 
+from functools import lru_cache
+
 import numpy as np
 import pytest
-from qiskit.quantum_info import (
-    Statevector,
-    state_fidelity,
-)
+from qiskit.quantum_info import Statevector
 from quimb.tensor import MatrixProductState, MPS_rand_state
 
 from mps_to_circuit import mps_to_circuit
 
 
+@lru_cache
+def _bit_reversal_permutation(size: int) -> np.ndarray:
+    """Return the permutation that reverses the qubit order of a statevector.
+
+    :param size: The length of the statevector.
+
+    :returns: The index of each amplitude after reversing the bits of its basis state.
+    """
+    assert (
+        size & (size - 1) == 0
+    ), "The input statevector must have a length that is a power of 2."
+    num_qubits = size.bit_length() - 1
+
+    indices = np.arange(size)
+    permutation = np.zeros_like(indices)
+    for k in range(num_qubits):
+        permutation |= ((indices >> k) & 1) << (num_qubits - 1 - k)
+
+    # The permutation is cached, so protect it from being modified by the caller.
+    permutation.flags.writeable = False
+    return permutation
+
+
 def _convert_to_little_endian(statevector: np.ndarray) -> np.ndarray:
     """Convert a big-endian statevector to little-endian qubit ordering.
 
@@ -28,14 +50,7 @@ def _convert_to_little_endian(statevector: np.ndarray) -> np.ndarray:
 
     :returns: The converted statevector.
     """
-    num_qubits = int(np.log2(len(statevector)))
-    assert 2**num_qubits == len(
-        statevector
-    ), "The input statevector must have a length that is a power of 2."
-
-    statevector = statevector.reshape([2] * num_qubits)
-    statevector = np.transpose(statevector, axes=range(num_qubits)[::-1])
-    return statevector.flatten()
+    return statevector.take(_bit_reversal_permutation(len(statevector)))
 
 
 def _mps_to_statevector(mps: MatrixProductState) -> np.ndarray:
@@ -48,55 +63,111 @@ def _mps_to_statevector(mps: MatrixProductState) -> np.ndarray:
 
     :return: A NumPy array representing the full statevector.
     """
-    return _convert_to_little_endian(mps.to_dense())
+    # Contract the 'lrp' tensors from left to right, one matrix product per site, keeping the
+    # physical indices of the contracted sites as the rows of the partial statevector.
+    arrays = mps.arrays
+    statevector = arrays[0].T
+    for array in arrays[1:-1]:
+        d_left, d_right, d = array.shape
+        matrix = array.transpose(0, 2, 1).reshape(d_left, d * d_right)
+        statevector = statevector @ matrix
+        statevector = statevector.reshape(-1, d_right)
+    statevector = statevector @ arrays[-1]
+
+    return _convert_to_little_endian(statevector.reshape(-1))
+
+
+@pytest.fixture(scope="module")
+def base_mps() -> MatrixProductState:
+    """A random MPS with bond dimension 16, from which lower bond dimension states are derived."""
+    return MPS_rand_state(L=8, bond_dim=16, seed=0)
+
+
+def _compressed_mps(mps: MatrixProductState, chi_max: int) -> MatrixProductState:
+    """
+    Compress a copy of an MPS to a given maximum bond dimension and normalize it.
+
+    :param mps: The MPS to compress. It is not modified.
+    :param chi_max: The maximum bond dimension.
+
+    :return: The compressed and normalized MPS.
+    """
+    compressed_mps = mps.copy()
+    compressed_mps.compress(max_bond=chi_max)
+    compressed_mps.normalize()
+    return compressed_mps
 
 
 # Exact method tests
 
 
-@pytest.mark.parametrize("chi_max", range(1, 17))
-def test_mps_to_circuit_exact_method(chi_max):
-    """Test exact MPS to quantum circuit conversion function."""
+def test_mps_to_circuit_exact_method(base_mps):
+    """Test exact MPS to quantum circuit conversion function for bond dimensions 1 to 16."""
 
-    mps = MPS_rand_state(L=8, bond_dim=chi_max)
-    mps.compress()
-    mps.normalize()
+    chi_max_values = range(1, 17)
+    fidelities = np.empty(len(chi_max_values))
 
-    assert chi_max <= 2 ** (
-        mps._L // 2
-    ), f"chi_max={chi_max} is too large for L={mps._L}."
+    for k, chi_max in enumerate(chi_max_values):
+        mps = _compressed_mps(base_mps, chi_max)
 
-    expected = Statevector(_mps_to_statevector(mps))
+        assert chi_max <= 2 ** (
+            mps._L // 2
+        ), f"chi_max={chi_max} is too large for L={mps._L}."
 
-    arrays = list(mps.arrays)
+        expected = _mps_to_statevector(mps)
+
+        arrays = list(mps.arrays)
+
+        qc = mps_to_circuit(arrays, method="exact")
+        result = Statevector(qc).data
+
+        fidelities[k] = np.abs(np.vdot(expected, result)) ** 2
+
+    assert np.all(fidelities > 1 - 1e-6), f"Fidelities per chi_max: {fidelities}"
+
+
+def test_mps_to_circuit_exact_method_rank_3_end_tensors():
+    """
+    Test exact MPS to quantum circuit conversion function.
+    - End tensors with explicit virtual dimensions of size 1 should be accepted, so that all
+      tensors can share the same rank and dtype
+    """
+
+    mps = MPS_rand_state(L=8, bond_dim=4, seed=0)
+    mps.normalize()
+
+    expected = _mps_to_statevector(mps)
+
+    arrays = [np.ascontiguousarray(array, dtype=np.complex128) for array in mps.arrays]
+    arrays[0] = arrays[0][np.newaxis, :, :]
+    arrays[-1] = arrays[-1][:, np.newaxis, :]
+    assert all(array.ndim == 3 for array in arrays)
 
     qc = mps_to_circuit(arrays, method="exact")
-    result = Statevector(qc)
+    result = Statevector(qc).data
 
-    fidelity = state_fidelity(expected, result)
-    assert np.isclose(fidelity, 1.0)
+    fidelity = np.abs(np.vdot(expected, result)) ** 2
+    assert fidelity > 1 - 1e-6
 
 
 # Approximate method tests
 
 
 @pytest.mark.parametrize("chi_max", range(1, 17))
-def test_mps_to_circuit_approx_method(chi_max):
+def test_mps_to_circuit_approx_method(base_mps, chi_max):
     """
     Test approximate MPS to quantum circuit conversion function.
     - The circuits should have the correct number of gates
     - Fidelity should increase as more layers are added
     """
 
-    mps = MPS_rand_state(L=8, bond_dim=chi_max)
-    mps.compress()
-    mps.normalize()
+    mps = _compressed_mps(base_mps, chi_max)
 
     assert chi_max <= 2 ** (
         mps._L // 2
     ), f"chi_max={chi_max} is too large for L={mps._L}."
 
-    expected = Statevector(_mps_to_statevector(mps))
+    expected = _mps_to_statevector(mps)
 
     arrays = list(mps.arrays)
 
@@ -113,8 +184,8 @@ def test_mps_to_circuit_approx_method(chi_max):
         # The history should store a number of circuits equal to num_layers.
         assert len(history["circuits"]) == num_layers
 
-        result = Statevector(qc)
-        fidelity = state_fidelity(expected, result)
+        result = Statevector(qc).data
+        fidelity = np.abs(np.vdot(expected, result)) ** 2
         previous_fidelity = 0.0
 
         # Fidelity after num_layers layers should be greater than fidelity after num_layers-1
@@ -132,14 +203,34 @@ def test_mps_to_circuit_approx_method_is_exact_for_chi_2():
     """
 
     num_sites = 8
-    mps = MPS_rand_state(L=num_sites, bond_dim=2)
+    mps = MPS_rand_state(L=num_sites, bond_dim=2, seed=0)
     mps.normalize()
 
-    expected = Statevector(_mps_to_statevector(mps))
+    expected = _mps_to_statevector(mps)
 
     arrays = list(mps.arrays)
     qc = mps_to_circuit(arrays, method="approximate", num_layers=1)
-    result = Statevector(qc)
-    fidelity = state_fidelity(expected, result)
+    result = Statevector(qc).data
+    fidelity = np.abs(np.vdot(expected, result)) ** 2
+
+    assert fidelity > 1 - 1e-6
+
+
+def test_mps_to_circuit_approx_method_is_reproducible_with_seed():
+    """
+    Test approximate MPS to quantum circuit conversion function.
+    - Circuits built with the same seed should prepare the same state
+    """
 
-    assert np.isclose(fidelity, 1.0)
+    mps = MPS_rand_state(L=8, bond_dim=8, seed=0)
+    mps.normalize()
+
+    arrays = list(mps.arrays)
+    results = [
+        Statevector(
+            mps_to_circuit(arrays, method="approximate", num_layers=3, seed=1)
+        ).data
+        for _ in range(2)
+    ]
+
+    assert np.array_equal(results[0], results[1])